@@ -1,15 +1,97 @@
-import pandas as pd
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+from tkinter import font as tkfont
+import csv
+import gzip
+import itertools
 import json
+import math
+import os
+import sys
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List
 
+try:
+    import orjson  # 可选依赖，序列化速度远快于标准库json
+except ImportError:
+    orjson = None
 
-@dataclass
-@dataclass
+DEBUG = False  # 调试模式下保存带缩进的JSON，便于人工查看
+NGRAM_SIZE = 3  # 子串搜索倒排索引使用的n-gram长度
+STOP_NGRAM_RATIO = 0.5  # 出现在超过该比例术语中的片段不参与求交集
+SEARCH_DELAY_MS = 150  # 输入停顿多久后才执行搜索（毫秒）
+TERMS_FILE = Path("data/terms.json.gz")  # 术语数据文件（gzip压缩的JSON）
+LEGACY_TERMS_FILE = Path("data/terms.json")  # 旧版本未压缩的术语数据文件
+EXPORT_FIELDS = ["term", "translation", "category", "context", "notes", "created_at"]  # 导出的列
+
+
+def dump_json(data) -> bytes:
+    """将数据序列化为UTF-8编码的JSON"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if DEBUG else 0)
+    if DEBUG:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_json(raw: bytes):
+    """解析UTF-8编码的JSON"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # 旧版本用json.dump保存，可能含有orjson不支持的NaN
+            pass
+    return json.loads(raw)
+
+
+def clean_text(value) -> str:
+    """将文件中的NaN、None等非字符串值规范为字符串"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def read_table(file_path: str):
+    """读取CSV或Excel文件
+    Returns:
+        tuple: (列名列表, 每行一个 列名 -> 字符串 的字典)
+    """
+    if file_path.lower().endswith('.csv'):
+        with open(file_path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+            return list(reader.fieldnames or []), rows
+
+    # 仅在处理Excel文件时才加载pandas
+    import pandas as pd
+    df = pd.read_excel(file_path)
+    df.columns = df.columns.astype(str)
+    df = df.fillna('').astype(str)
+    return list(df.columns), df.to_dict('records')
+
+
+def write_table(file_path: str, header: List[str], rows: List[list]):
+    """将数据写入CSV或Excel文件"""
+    if file_path.lower().endswith('.csv'):
+        with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        return
+
+    import pandas as pd
+    pd.DataFrame(rows, columns=header).to_excel(file_path, index=False)
+
+
+TermKey = str  # 术语键：驻留后的术语原文
+
+
+@dataclass(slots=True)
 class Term:
     """术语类，用于存储单个术语的所有信息"""
     term: str  # 原文
@@ -20,15 +102,21 @@ class Term:
     created_at: str = ""  # 创建时间
     flags: set = None  # 术语标记
     history: list = None  # 历史记录
+    _term_lc: str = field(default="", init=False, repr=False, compare=False)  # 小写原文缓存
+    _translation_lc: str = field(default="", init=False, repr=False, compare=False)  # 小写译文缓存
 
     def __post_init__(self):
         """初始化后自动设置创建时间和其他字段"""
+        # 驻留原文，使其作为字典键和索引元素时共用同一个字符串对象
+        self.term = sys.intern(self.term)
         if not self.created_at:
             self.created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         if self.flags is None:
             self.flags = set()
         if self.history is None:
             self.history = []
+        self._term_lc = self.term.lower()
+        self._translation_lc = self.translation.lower()
 
 
 class GlossaryManager:
@@ -36,9 +124,24 @@ class GlossaryManager:
 
     def __init__(self):
         """初始化术语管理器"""
-        self.terms: Dict[str, Term] = {}  # 存储所有术语
+        self.terms: Dict[TermKey, Term] = {}  # 存储所有术语
+        self._buffer_depth = 0  # buffered() 的嵌套层数
+        self._dirty = False  # 缓冲期间是否有未保存的修改
+        self._load_failed = False  # 加载失败时禁止保存，避免覆盖无法读取的术语文件
+        self._version = 0  # 术语数据版本号，每次增删术语时递增
+        self._stats_cache = (None, None)  # get_statistics() 的缓存：(版本号, 结果)
+        self._analysis_cache = (None, None)  # analyze() 的缓存：(版本号, 结果)
         self.load_terms()  # 加载已保存的术语
 
+        # 子串搜索用的倒排索引：NGRAM_SIZE长度的片段 -> 包含该片段的术语原文集合，
+        # 首次搜索较长文本时才建立
+        self._ngram_index: Dict[str, set] = None
+        # 统计计数，随术语增删增量维护
+        self._translated_count = 0
+        self._category_counts: Counter = Counter()
+        for term in self.terms.values():
+            self._index_term(term)
+
     def add_term(self, term: Term) -> bool:
         """添加新术语
         Args:
@@ -49,14 +152,34 @@ class GlossaryManager:
         try:
             if not term.term.strip() or not term.translation.strip():
                 raise ValueError("术语和翻译不能为空")
-            self.terms[term.term] = term
-            self.save_terms()  # 保存到文件
+            self._put_term(term)
             return True
         except Exception as e:
             messagebox.showerror("错误", f"添加术语失败：{str(e)}")
             return False
 
-    def remove_term(self, term_key: str) -> bool:
+    def add_terms(self, terms: List[Term]) -> int:
+        """批量添加术语，不再逐条校验，调用方需保证原文和译文非空
+        Args:
+            terms: Term对象列表
+        Returns:
+            int: 添加的术语数量
+        """
+        with self.buffered():
+            for term in terms:
+                self._put_term(term)
+        return len(terms)
+
+    def _put_term(self, term: Term):
+        """写入术语（同名术语被替换）并保存"""
+        if term.term in self.terms:
+            self._unindex_term(self.terms[term.term])
+        self.terms[term.term] = term
+        self._index_term(term)
+        self._version += 1
+        self.save_terms()  # 保存到文件
+
+    def remove_term(self, term_key: TermKey) -> bool:
         """删除术语
         Args:
             term_key: 术语原文
@@ -65,7 +188,9 @@ class GlossaryManager:
         """
         try:
             if term_key in self.terms:
+                self._unindex_term(self.terms[term_key])
                 del self.terms[term_key]
+                self._version += 1
                 self.save_terms()
                 return True
             return False
@@ -73,11 +198,123 @@ class GlossaryManager:
             messagebox.showerror("错误", f"删除术语失败：{str(e)}")
             return False
 
+    @staticmethod
+    def _ngrams(text: str, size: int = NGRAM_SIZE) -> set:
+        """提取文本中所有长度为size的片段"""
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    def _ensure_ngram_index(self) -> Dict[str, set]:
+        """返回倒排索引，尚未建立时为全部术语建立"""
+        if self._ngram_index is None:
+            index = {}
+            for term in self.terms.values():
+                for gram in self._ngrams(term._term_lc) | self._ngrams(term._translation_lc):
+                    index.setdefault(gram, set()).add(term.term)
+            self._ngram_index = index
+        return self._ngram_index
+
+    def _index_term(self, term: Term):
+        """更新统计计数，倒排索引已建立时同时写入术语的原文和译文"""
+        if term.translation:
+            self._translated_count += 1
+        if term.category:
+            self._category_counts[term.category] += 1
+
+        if self._ngram_index is None:
+            return
+        for gram in self._ngrams(term._term_lc) | self._ngrams(term._translation_lc):
+            self._ngram_index.setdefault(gram, set()).add(term.term)
+
+    def _unindex_term(self, term: Term):
+        """更新统计计数，倒排索引已建立时从中移除术语并清理不再使用的片段"""
+        if term.translation:
+            self._translated_count -= 1
+        if term.category:
+            self._category_counts[term.category] -= 1
+            if not self._category_counts[term.category]:
+                del self._category_counts[term.category]
+
+        if self._ngram_index is None:
+            return
+        for gram in self._ngrams(term._term_lc) | self._ngrams(term._translation_lc):
+            keys = self._ngram_index.get(gram)
+            if keys is not None:
+                keys.discard(term.term)
+                if not keys:
+                    del self._ngram_index[gram]
+
+    def search(self, text: str) -> List[TermKey]:
+        """搜索术语
+        Args:
+            text: 搜索文本，不区分大小写，匹配原文或译文中的任意子串
+        Returns:
+            List[TermKey]: 匹配的术语原文列表，按术语添加顺序排列
+        """
+        text = text.lower()
+        terms = self.terms
+        if len(text) < NGRAM_SIZE:
+            # 过短的文本无法使用倒排索引，直接扫描小写缓存
+            return [
+                key for key, term in terms.items()
+                if text in term._term_lc or text in term._translation_lc
+            ]
+
+        # 取各片段倒排列表的交集作为候选，再逐个确认包含关系
+        index = self._ensure_ngram_index()
+        postings = []
+        for gram in self._ngrams(text):
+            keys = index.get(gram)
+            if keys is None:
+                return []
+            postings.append(keys)
+
+        # 从最短的倒排列表开始求交集，结果为空时立即停止；过于常见的片段
+        # 几乎起不到筛选作用，直接跳过，交给最后的包含检查
+        postings.sort(key=len)
+        stop_size = len(self.terms) * STOP_NGRAM_RATIO
+        candidates = set(postings[0])
+        for keys in postings[1:]:
+            if not candidates or len(keys) > stop_size:
+                break
+            candidates &= keys
+
+        matches = {
+            key for key in candidates
+            if text in terms[key]._term_lc or text in terms[key]._translation_lc
+        }
+        return [key for key in terms if key in matches]
+
+    @contextmanager
+    def buffered(self):
+        """批量修改时延迟保存，退出最外层时统一写入一次文件
+
+        用法:
+            with manager.buffered():
+                for term in terms:
+                    manager.add_term(term)
+        """
+        self._buffer_depth += 1
+        try:
+            yield self
+        finally:
+            self._buffer_depth -= 1
+            if self._buffer_depth == 0 and self._dirty:
+                self.save_terms()
+
     def save_terms(self):
-        """保存术语到文件"""
+        """保存术语到文件，在buffered()中只标记待保存"""
+        if self._buffer_depth > 0:
+            self._dirty = True
+            return
+        self._dirty = False
+        if self._load_failed:
+            messagebox.showerror("错误", "术语文件加载失败，为避免覆盖原文件，本次修改未保存")
+            return
+
+        tmp_file = TERMS_FILE.with_name(TERMS_FILE.name + ".tmp")
         try:
             # 确保data目录存在
-            Path("data").mkdir(exist_ok=True)
+            TERMS_FILE.parent.mkdir(exist_ok=True)
 
             # 将术语数据转换为可序列化的格式
             data = {
@@ -92,77 +329,88 @@ class GlossaryManager:
                 for term_key, term in self.terms.items()
             }
 
-            # 保存到JSON文件
-            with open("data/terms.json", "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 先写入临时文件并落盘，再替换原文件，避免崩溃或断电时损坏原文件
+            with open(tmp_file, "wb") as f:
+                f.write(gzip.compress(dump_json(data), compresslevel=1))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, TERMS_FILE)
 
         except Exception as e:
+            tmp_file.unlink(missing_ok=True)
             messagebox.showerror("错误", f"保存术语失败：{str(e)}")
 
     def load_terms(self):
-        """从文件加载术语"""
+        """从文件加载术语，兼容旧版本未压缩的文件（下次保存时转为压缩格式）"""
         try:
-            if Path("data/terms.json").exists():
-                with open("data/terms.json", "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.terms = {
-                        key: Term(**value)
-                        for key, value in data.items()
-                    }
+            if TERMS_FILE.exists():
+                raw = gzip.decompress(TERMS_FILE.read_bytes())
+            elif LEGACY_TERMS_FILE.exists():
+                raw = LEGACY_TERMS_FILE.read_bytes()
+            else:
+                return
+
+            data = load_json(raw)
+            self.terms = {
+                sys.intern(key): Term(**{field: clean_text(value.get(field)) for field in EXPORT_FIELDS})
+                for key, value in data.items()
+            }
         except Exception as e:
+            self._load_failed = True
             messagebox.showerror("错误", f"加载术语失败：{str(e)}")
 
     def get_statistics(self) -> dict:
-        """获取术语统计信息"""
-        total = len(self.terms)
-        translated = sum(1 for t in self.terms.values() if t.translation)
-        categories = {}
-        for term in self.terms.values():
-            if term.category:
-                categories[term.category] = categories.get(term.category, 0) + 1
+        """获取术语统计信息，术语未变更时直接返回缓存结果"""
+        if self._stats_cache[0] == self._version:
+            return self._stats_cache[1]
 
-        return {
+        total = len(self.terms)
+        translated = self._translated_count
+        stats = {
             "总数": total,
             "已翻译": translated,
             "翻译进度": f"{(translated / total * 100):.1f}%" if total else "0%",
-            "分类统计": categories
-        }
-
-    def check_duplicates(self) -> dict:
-        """检查重复术语和翻译"""
-        duplicates = {
-            "terms": [],  # 重复术语
-            "translations": []  # 重复翻译
+            "分类统计": dict(self._category_counts)
         }
+        self._stats_cache = (self._version, stats)
+        return stats
 
-        translations = {}
-        for term in self.terms.values():
-            # 检查重复翻译
-            if term.translation in translations:
-                duplicates["translations"].append((
-                    translations[term.translation].term,
-                    term.term
-                ))
-            else:
-                translations[term.translation] = term
-
-        return duplicates
+    def analyze(self) -> dict:
+        """一次遍历完成查重和一致性检查，结果缓存到术语发生变更为止
+        Returns:
+            dict: dup_translations 为使用了相同翻译的 (术语, 术语) 列表，
+                inconsistent 为一致性问题描述列表
+        """
+        if self._analysis_cache[0] == self._version:
+            return self._analysis_cache[1]
 
-    def check_consistency(self) -> list:
-        """检查术语翻译一致性"""
-        issues = []
-        translations = {}
+        dup_translations = []
+        term_by_translation = {}  # 译文 -> 第一个使用该译文的术语原文
+        translations_by_term = {}  # 规范化原文 -> {译文: 术语原文}
 
         for term in self.terms.values():
-            # 检查同一个原文是否有不同翻译
-            if term.term in translations:
-                if translations[term.term] != term.translation:
-                    issues.append(f"术语'{term.term}'有不同的翻译: "
-                                  f"{translations[term.term]} vs {term.translation}")
-            else:
-                translations[term.term] = term.translation
+            # 检查重复翻译
+            first = term_by_translation.setdefault(term.translation, term.term)
+            if first != term.term:
+                dup_translations.append((first, term.term))
+
+            # 记录规范化后相同的原文对应的不同翻译
+            variants = translations_by_term.setdefault(term._term_lc.strip(), {})
+            variants.setdefault(term.translation, term.term)
+
+        inconsistent = [
+            "术语" + "/".join(f"'{t}'" for t in variants.values()) + "有不同的翻译: "
+            + " vs ".join(variants)
+            for variants in translations_by_term.values()
+            if len(variants) > 1
+        ]
 
-        return issues
+        analysis = {
+            "dup_translations": dup_translations,
+            "inconsistent": inconsistent
+        }
+        self._analysis_cache = (self._version, analysis)
+        return analysis
 
 
 class GlossaryGUI:
@@ -175,6 +423,7 @@ class GlossaryGUI:
 
         # 初始化术语管理器
         self.manager = GlossaryManager()
+        self._search_after_id = None  # 待执行的搜索任务
 
         # 设置界面
         self.setup_ui()
@@ -221,13 +470,8 @@ class GlossaryGUI:
 
     def create_table(self, parent):
         """创建术语表格"""
-        # 创建表格框架
-        table_frame = ttk.Frame(parent)
-        table_frame.grid(row=2, column=0, sticky="nsew")
-
         # 定义列
         columns = ("term", "translation", "category", "context", "notes")
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings")
 
         # 设置列标题
         column_names = {
@@ -238,89 +482,91 @@ class GlossaryGUI:
             "notes": "备注"
         }
 
-        for col in columns:
-            self.tree.heading(col, text=column_names[col])
-            self.tree.column(col, width=100)
-
-        # 添加滚动条
-        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-
-        # 放置表格和滚动条
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        # 虚拟表格只绘制可见的行，行id为术语原文
+        self.table = VirtualTable(
+            parent,
+            [column_names[col] for col in columns],
+            lambda term_key: self._row_values(self.manager.terms[term_key])
+        )
+        self.table.grid(row=2, column=0, sticky="nsew")
 
         # 绑定双击事件
-        self.tree.bind("<Double-1>", lambda e: self.edit_term())
+        self.table.bind("<Double-1>", lambda e: self.edit_term())
 
-        # 更新表格数据
         self.update_table()
 
-        # 配置表格框架的网格权重
-        table_frame.grid_rowconfigure(0, weight=1)
-        table_frame.grid_columnconfigure(0, weight=1)
+    @staticmethod
+    def _row_values(term):
+        """返回术语在表格中显示的各列内容"""
+        return (
+            term.term,
+            term.translation,
+            term.category,
+            term.context,
+            term.notes
+        )
 
     def update_table(self, search_text=""):
-        """更新表格内容"""
-        # 清空现有内容
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # 根据搜索文本筛选并添加术语
-        search_text = search_text.lower()
-        for term in self.manager.terms.values():
-            if (not search_text or
-                    search_text in term.term.lower() or
-                    search_text in term.translation.lower()):
-                self.tree.insert("", tk.END, values=(
-                    term.term,
-                    term.translation,
-                    term.category,
-                    term.context,
-                    term.notes
-                ))
+        """更新表格内容，只重新计算要显示的行，绘制交给虚拟表格"""
+        if search_text:
+            rows = self.manager.search(search_text)
+        else:
+            rows = list(self.manager.terms)
+        self.table.set_rows(rows)
 
     def on_search(self, *args):
-        """搜索功能"""
+        """搜索功能，连续输入时只在停顿后执行一次搜索"""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DELAY_MS, self._run_search)
+
+    def _run_search(self):
+        """执行延迟的搜索"""
+        self._search_after_id = None
         self.update_table(self.search_var.get())
+        self.table.yview_moveto(0)
 
     def add_term(self):
         """添加术语"""
         dialog = TermDialog(self.root)
         if result := dialog.show():
             if self.manager.add_term(result):
-                self.update_table()
+                self.update_table(self.search_var.get())
+                self.update_status_bar()
 
     def edit_term(self):
         """编辑术语"""
-        selection = self.tree.selection()
+        selection = self.table.selection()
         if not selection:
             messagebox.showwarning("警告", "请先选择要编辑的术语")
             return
 
-        item = selection[0]
-        term_key = self.tree.item(item)["values"][0]
+        term_key = selection[0]
         term = self.manager.terms.get(term_key)
 
         if term:
             dialog = TermDialog(self.root, term)
             if result := dialog.show():
-                self.manager.remove_term(term_key)
-                self.manager.add_term(result)
-                self.update_table()
+                # 删除和重新添加合并为一次保存
+                with self.manager.buffered():
+                    self.manager.remove_term(term_key)
+                    self.manager.add_term(result)
+                self.update_table(self.search_var.get())
+                self.update_status_bar()
 
     def delete_term(self):
         """删除术语"""
-        selection = self.tree.selection()
+        selection = self.table.selection()
         if not selection:
             messagebox.showwarning("警告", "请先选择要删除的术语")
             return
 
         if messagebox.askyesno("确认", "确定要删除选中的术语吗？"):
-            for item in selection:
-                term_key = self.tree.item(item)["values"][0]
-                if self.manager.remove_term(term_key):
-                    self.update_table()
+            with self.manager.buffered():
+                for term_key in selection:
+                    self.manager.remove_term(term_key)
+            self.update_table(self.search_var.get())
+            self.update_status_bar()
 
     def import_terms(self):
         """导入术语"""
@@ -337,36 +583,32 @@ class GlossaryGUI:
 
         try:
             # 读取文件
-            if file_path.lower().endswith('.csv'):
-                df = pd.read_csv(file_path)
-            else:
-                df = pd.read_excel(file_path)
+            columns, rows = read_table(file_path)
 
             # 获取列映射
-            dialog = ColumnMappingDialog(self.root, list(df.columns))
+            dialog = ColumnMappingDialog(self.root, columns)
             if not (mapping := dialog.show()):
                 return
 
-            # 应用列映射
-            df = df.rename(columns={v: k for k, v in mapping.items() if v})
+            # 应用列映射，未映射的可选列填空
+            fields = ['Term', 'Translation', 'Category', 'Context', 'Notes']
+            sources = [mapping.get(field) for field in fields]
+            records = (
+                [(row.get(source) or '') if source else '' for source in sources]
+                for row in rows
+            )
+
+            # 预先过滤掉原文或译文为空的行，其余行无需再逐条校验
+            imported = [
+                Term(*record) for record in records
+                if record[0].strip() and record[1].strip()
+            ]
 
             # 导入术语
-            success_count = 0
-            for _, row in df.iterrows():
-                try:
-                    term = Term(
-                        term=row['Term'],
-                        translation=row['Translation'],
-                        category=row.get('Category', ''),
-                        context=row.get('Context', ''),
-                        notes=row.get('Notes', '')
-                    )
-                    if self.manager.add_term(term):
-                        success_count += 1
-                except Exception as e:
-                    continue
-
-            self.update_table()
+            success_count = self.manager.add_terms(imported)
+
+            self.update_table(self.search_var.get())
+            self.update_status_bar()
             messagebox.showinfo("导入完成", f"成功导入 {success_count} 条术语")
 
         except Exception as e:
@@ -386,15 +628,12 @@ class GlossaryGUI:
             return
 
         try:
-            # 转换为DataFrame
-            data = [vars(term) for term in self.manager.terms.values()]
-            df = pd.DataFrame(data)
-
             # 导出文件
-            if file_path.lower().endswith('.csv'):
-                df.to_csv(file_path, index=False, encoding='utf-8-sig')
-            else:
-                df.to_excel(file_path, index=False)
+            rows = [
+                [getattr(term, field) for field in EXPORT_FIELDS]
+                for term in self.manager.terms.values()
+            ]
+            write_table(file_path, EXPORT_FIELDS, rows)
 
             messagebox.showinfo("导出完成", "术语表已成功导出")
 
@@ -426,7 +665,7 @@ class GlossaryGUI:
 
     def show_duplicates(self):
         """显示重复检查结果"""
-        duplicates = self.manager.check_duplicates()
+        duplicates = self.manager.analyze()["dup_translations"]
 
         # 创建查重窗口
         dup_window = tk.Toplevel(self.root)
@@ -437,9 +676,9 @@ class GlossaryGUI:
         text = tk.Text(dup_window, wrap=tk.WORD, width=50, height=20)
         text.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
 
-        if duplicates["translations"]:
+        if duplicates:
             text.insert(tk.END, "发现重复翻译:\n")
-            for term1, term2 in duplicates["translations"]:
+            for term1, term2 in duplicates:
                 text.insert(tk.END, f"- '{term1}' 和 '{term2}' 使用了相同的翻译\n")
         else:
             text.insert(tk.END, "未发现重复翻译\n")
@@ -448,7 +687,7 @@ class GlossaryGUI:
 
     def show_consistency(self):
         """显示一致性检查结果"""
-        issues = self.manager.check_consistency()
+        issues = self.manager.analyze()["inconsistent"]
 
         # 创建一致性检查窗口
         cons_window = tk.Toplevel(self.root)
@@ -476,11 +715,10 @@ class GlossaryGUI:
 
     def update_status_bar(self):
         """更新状态栏信息"""
-        total = len(self.manager.terms)
-        translated = sum(1 for term in self.manager.terms.values() if term.translation)
+        stats = self.manager.get_statistics()
         self.status_bar.config(
-            text=f" 总计: {total} 条术语 | 已翻译: {translated} 条 | "
-                 f"完成度: {(translated / total * 100):.1f}%" if total else "0%"
+            text=f" 总计: {stats['总数']} 条术语 | 已翻译: {stats['已翻译']} 条 | "
+                 f"完成度: {stats['翻译进度']}"
         )
 
     def setup_context_menu(self):
@@ -494,42 +732,347 @@ class GlossaryGUI:
         self.context_menu.add_separator()
         self.context_menu.add_command(label="复制整行", command=self.copy_full_term)
 
-        # 在树形视图中绑定右键事件
-        self.tree.bind("<Button-3>", self.show_context_menu)
+        # 在表格中绑定右键事件
+        self.table.bind("<Button-3>", self.show_context_menu)
 
     def show_context_menu(self, event):
         """显示右键菜单"""
         # 先获取点击位置的项
-        item = self.tree.identify_row(event.y)
+        item = self.table.identify_row(event.y)
         if item:
             # 选中点击的项
-            self.tree.selection_set(item)
+            self.table.selection_set(item)
             # 显示菜单
             self.context_menu.post(event.x_root, event.y_root)
 
     def copy_term_field(self, field):
         """复制指定字段到剪贴板"""
-        selection = self.tree.selection()
+        selection = self.table.selection()
         if selection:
-            item = selection[0]
-            fields = ["term", "translation", "category", "context", "notes"]
-            value = self.tree.item(item)["values"][fields.index(field)]
+            value = getattr(self.manager.terms[selection[0]], field)
             self.root.clipboard_clear()
             self.root.clipboard_append(str(value))
             messagebox.showinfo("提示", f"已复制{field}到剪贴板")
 
     def copy_full_term(self):
         """复制整行信息到剪贴板"""
-        selection = self.tree.selection()
+        selection = self.table.selection()
         if selection:
-            item = selection[0]
-            values = self.tree.item(item)["values"]
+            values = self._row_values(self.manager.terms[selection[0]])
             text = "\t".join(str(v) for v in values)
             self.root.clipboard_clear()
             self.root.clipboard_append(text)
             messagebox.showinfo("提示", "已复制整行信息到剪贴板")
 
 
+class VirtualTable(ttk.Frame):
+    """虚拟滚动表格，只绘制可见区域内的行，适用于大量术语"""
+
+    ROW_PADDING = 6  # 行高在字体行距之外的留白
+    CELL_PADDING = 4  # 单元格文字与列边界的距离
+    SELECT_COLOR = "#cce8ff"  # 选中行的背景色
+    LINE_COLOR = "#e0e0e0"  # 分隔线颜色
+    HEADER_COLOR = "#f0f0f0"  # 表头背景色
+    MIN_COLUMN_WIDTH = 30  # 拖动调整列宽时的最小宽度
+    RESIZE_MARGIN = 4  # 表头列边界两侧可拖动的范围
+
+    def __init__(self, parent, headings, get_values):
+        """
+        Args:
+            parent: 父组件
+            headings: 各列标题
+            get_values: 根据行id返回该行各列内容的函数
+        """
+        super().__init__(parent)
+        self.headings = headings
+        self.get_values = get_values
+        self.rows = []  # 当前显示的全部行id
+        self.top = 0  # 可见区域第一行的下标
+        self._selected = {}  # 选中的行id，按选中顺序保存
+        self._anchor = None  # Shift多选的起始行下标
+        self._cursor = None  # 键盘导航的当前行下标
+        self._col_widths = None  # 用户调整过的列宽，None表示平均分配
+        self._resizing = None  # 正在拖动的列：(列下标, 列左边界x坐标)
+
+        self.font = tkfont.nametofont("TkDefaultFont")
+        self.row_height = self.font.metrics("linespace") + self.ROW_PADDING
+        self.char_width = max(1, self.font.measure("0"))
+
+        # 表头、表体和滚动条
+        self.header = tk.Canvas(self, height=self.row_height, background=self.HEADER_COLOR,
+                                highlightthickness=0)
+        self.body = tk.Canvas(self, background="white", takefocus=1, highlightthickness=1,
+                              highlightbackground=self.LINE_COLOR)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.header.grid(row=0, column=0, sticky="ew")
+        self.body.grid(row=1, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, rowspan=2, sticky="ns")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.header.bind("<Configure>", lambda e: self._draw_header())
+        self.header.bind("<Motion>", self._on_header_motion)
+        self.header.bind("<Button-1>", self._on_header_press)
+        self.header.bind("<B1-Motion>", self._on_header_drag)
+        self.header.bind("<ButtonRelease-1>", lambda e: setattr(self, "_resizing", None))
+        self.body.bind("<Configure>", lambda e: self.redraw())
+        self.body.bind("<Button-1>", self._on_click)
+        self.body.bind("<Control-Button-1>", self._on_ctrl_click)
+        self.body.bind("<Shift-Button-1>", self._on_shift_click)
+        self.body.bind("<MouseWheel>", self._on_mousewheel)
+        self.body.bind("<Button-4>", lambda e: self.yview("scroll", -3, "units"))
+        self.body.bind("<Button-5>", lambda e: self.yview("scroll", 3, "units"))
+
+        # 键盘导航：方向键、翻页、首尾行，按住Shift时扩展选择范围
+        keys = {
+            "Up": lambda: self._current() - 1,
+            "Down": lambda: self._current() + 1,
+            "Prior": lambda: self._current() - self._page_size(),
+            "Next": lambda: self._current() + self._page_size(),
+            "Home": lambda: 0,
+            "End": lambda: len(self.rows) - 1,
+        }
+        for key, target in keys.items():
+            self.body.bind(f"<{key}>", lambda e, t=target: self._move_cursor(t()))
+            self.body.bind(f"<Shift-{key}>", lambda e, t=target: self._move_cursor(t(), extend=True))
+
+    def bind(self, sequence=None, func=None, add=None):
+        """事件绑定到表体，以便获取行坐标"""
+        return self.body.bind(sequence, func, add)
+
+    def set_rows(self, rows):
+        """设置要显示的行id列表并重绘，保留仍然存在的选中行、多选起点和当前行"""
+        anchor_key = self._key_at(self._anchor)
+        cursor_key = self._key_at(self._cursor)
+        self.rows = rows
+        if self._selected:
+            present = set(rows)
+            self._selected = {key: None for key in self._selected if key in present}
+        self._anchor = self._index_of(anchor_key)
+        self._cursor = self._index_of(cursor_key)
+        self.redraw()
+
+    def _key_at(self, index):
+        """返回下标对应的行id，下标为空时返回None"""
+        return self.rows[index] if index is not None and index < len(self.rows) else None
+
+    def _index_of(self, key):
+        """返回行id在当前行列表中的下标，不存在时返回None"""
+        if key is None:
+            return None
+        try:
+            return self.rows.index(key)
+        except ValueError:
+            return None
+
+    def selection(self):
+        """返回选中的行id"""
+        return tuple(self._selected)
+
+    def selection_set(self, *keys):
+        """设置选中的行"""
+        self._selected = dict.fromkeys(keys)
+        self.redraw()
+
+    def identify_row(self, y):
+        """返回表体中y坐标处的行id，没有行时返回空字符串"""
+        index = self._index_at(y)
+        return self.rows[index] if index is not None else ""
+
+    def _index_at(self, y):
+        """返回表体中y坐标处的行下标"""
+        index = self.top + int(y // self.row_height)
+        return index if 0 <= index < len(self.rows) else None
+
+    def _page_size(self):
+        """可见区域能容纳的完整行数"""
+        return max(1, self.body.winfo_height() // self.row_height)
+
+    def yview(self, *args):
+        """滚动条协议：moveto 比例，或 scroll 数量 units/pages"""
+        if args and args[0] == "moveto":
+            top = int(float(args[1]) * len(self.rows))
+        elif args and args[0] == "scroll":
+            step = self._page_size() if args[2] == "pages" else 1
+            top = self.top + int(args[1]) * step
+        else:
+            return
+        self.top = max(0, min(top, len(self.rows) - self._page_size()))
+        self.redraw()
+
+    def yview_moveto(self, fraction):
+        """滚动到指定比例的位置"""
+        self.yview("moveto", fraction)
+
+    def _on_mousewheel(self, event):
+        """处理Windows/macOS的滚轮事件"""
+        units = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self.yview("scroll", units * 3, "units")
+
+    def _on_click(self, event):
+        """单击选中一行"""
+        self.body.focus_set()
+        index = self._index_at(event.y)
+        self._anchor = self._cursor = index
+        self.selection_set(*([self.rows[index]] if index is not None else []))
+
+    def _on_ctrl_click(self, event):
+        """Ctrl+单击切换一行的选中状态"""
+        self.body.focus_set()
+        index = self._index_at(event.y)
+        if index is None:
+            return
+        key = self.rows[index]
+        if key in self._selected:
+            del self._selected[key]
+        else:
+            self._selected[key] = None
+        self._anchor = self._cursor = index
+        self.redraw()
+
+    def _on_shift_click(self, event):
+        """Shift+单击选中从上次单击的行到当前行的范围"""
+        self.body.focus_set()
+        index = self._index_at(event.y)
+        if index is None:
+            return
+        self._select_range(index)
+        self.redraw()
+
+    def _select_range(self, index):
+        """选中从锚点行到index的范围"""
+        if self._anchor is None:
+            self._anchor = index
+        start, end = sorted((self._anchor, index))
+        self._selected = dict.fromkeys(self.rows[start:end + 1])
+        self._cursor = index
+
+    def _current(self):
+        """键盘导航的当前行下标，尚未选择时为-1"""
+        return self._cursor if self._cursor is not None else -1
+
+    def _move_cursor(self, index, extend=False):
+        """把当前行移动到index并选中，必要时滚动使其可见"""
+        if self.rows:
+            index = max(0, min(index, len(self.rows) - 1))
+            if extend:
+                self._select_range(index)
+            else:
+                self._anchor = self._cursor = index
+                self._selected = {self.rows[index]: None}
+
+            # 当前行在可见区域之外时滚动过去，yview会负责重绘
+            page = self._page_size()
+            if index < self.top:
+                self.yview("scroll", index - self.top, "units")
+            elif index >= self.top + page:
+                self.yview("scroll", index - (self.top + page - 1), "units")
+            else:
+                self.redraw()
+        return "break"
+
+    def _column_widths(self):
+        """各列宽度：默认平均分配，调整过后最后一列填满剩余宽度"""
+        width = self.body.winfo_width()
+        if self._col_widths is None:
+            return [width / len(self.headings)] * len(self.headings)
+        widths = list(self._col_widths)
+        widths[-1] = max(self.MIN_COLUMN_WIDTH, width - sum(widths[:-1]))
+        return widths
+
+    def _column_lefts(self, widths):
+        """各列左边界的x坐标"""
+        return list(itertools.accumulate([0] + widths[:-1]))
+
+    def _boundary_at(self, x):
+        """返回x坐标处可拖动的列边界对应的列下标（最后一列右边界除外）"""
+        right = 0
+        for col, width in enumerate(self._column_widths()[:-1]):
+            right += width
+            if abs(x - right) <= self.RESIZE_MARGIN:
+                return col
+        return None
+
+    def _on_header_motion(self, event):
+        """鼠标位于列边界时显示调整列宽的光标"""
+        cursor = "sb_h_double_arrow" if self._boundary_at(event.x) is not None else ""
+        self.header.configure(cursor=cursor)
+
+    def _on_header_press(self, event):
+        """在列边界按下鼠标时开始调整列宽"""
+        col = self._boundary_at(event.x)
+        if col is not None:
+            widths = self._column_widths()
+            self._col_widths = widths
+            self._resizing = (col, self._column_lefts(widths)[col])
+
+    def _on_header_drag(self, event):
+        """拖动列边界调整列宽"""
+        if self._resizing is None:
+            return
+        col, left = self._resizing
+        # 为右侧各列保留空间，表格总宽度不超过可见区域
+        widths = self._col_widths
+        limit = self.body.winfo_width() - left - sum(widths[col + 1:-1]) - self.MIN_COLUMN_WIDTH
+        widths[col] = max(self.MIN_COLUMN_WIDTH, min(event.x - left, limit))
+        self._draw_header()
+        self.redraw()
+
+    def _clip(self, text, width):
+        """截断超出列宽的文字"""
+        if self.font.measure(text) <= width:
+            return text
+        # 先按平均字符宽度粗略截断，再逐字缩短
+        text = text[:max(0, int(width // self.char_width))]
+        while text and self.font.measure(text + "…") > width:
+            text = text[:-1]
+        return text + "…"
+
+    def _draw_header(self):
+        """绘制表头"""
+        canvas = self.header
+        canvas.delete("all")
+        widths = self._column_widths()
+        for heading, x, col_width in zip(self.headings, self._column_lefts(widths), widths):
+            canvas.create_text(x + self.CELL_PADDING, self.row_height / 2, anchor=tk.W,
+                               text=self._clip(heading, col_width - 2 * self.CELL_PADDING),
+                               font=self.font)
+            canvas.create_line(x, 0, x, self.row_height, fill=self.LINE_COLOR)
+
+    def redraw(self):
+        """只绘制可见区域内的行，并同步滚动条位置"""
+        canvas = self.body
+        canvas.delete("all")
+        total = len(self.rows)
+        page = self._page_size()
+        self.top = max(0, min(self.top, total - page))
+
+        width = canvas.winfo_width()
+        widths = self._column_widths()
+        columns = [
+            (x + self.CELL_PADDING, col_width - 2 * self.CELL_PADDING)
+            for x, col_width in zip(self._column_lefts(widths), widths)
+        ]
+        # 多画一行以填满底部不完整的空间
+        for index in range(self.top, min(self.top + page + 1, total)):
+            key = self.rows[index]
+            y = (index - self.top) * self.row_height
+            if key in self._selected:
+                canvas.create_rectangle(0, y, width, y + self.row_height,
+                                        fill=self.SELECT_COLOR, outline="")
+            for (x, text_width), value in zip(columns, self.get_values(key)):
+                canvas.create_text(x, y + self.row_height / 2,
+                                   anchor=tk.W, text=self._clip(str(value), text_width),
+                                   font=self.font)
+            canvas.create_line(0, y + self.row_height, width, y + self.row_height,
+                               fill=self.LINE_COLOR)
+
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + page) / total))
+        else:
+            self.scrollbar.set(0, 1)
+
+
 class TermDialog:
     """术语编辑对话框"""
 